@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Simple script to generate PDF from the proforma Excel file."""
 
+import os
 import sys
 import logging
 from pathlib import Path
@@ -38,8 +39,8 @@ def main():
         logger.info("Converting proforma sheets to PDF...")
         pdf_path = converter.convert_proforma_to_pdf("Proforma_Complete.pdf")
         
-        # Get file size
-        pdf_size = Path(pdf_path).stat().st_size
+        # Get file size; stat once and reuse it
+        pdf_size = os.path.getsize(pdf_path)
         
         # Success
         print(f"\n🎉 PDF Generated Successfully!")
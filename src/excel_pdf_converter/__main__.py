@@ -2,12 +2,11 @@
 
 import argparse
 import logging
+import os
 import sys
 from pathlib import Path
 from typing import List, Optional
 
-from .converter import ExcelToPDFConverter
-
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -100,18 +99,25 @@ def main() -> None:
         logger.error(f"File must be an Excel file (.xlsx or .xls): {excel_path}")
         sys.exit(1)
     
+    # List sheets if requested - reading only the workbook metadata is far
+    # cheaper than constructing the full converter
+    if args.list_sheets:
+        from python_calamine import CalamineWorkbook
+
+        sheets = CalamineWorkbook.from_path(str(excel_path)).sheet_names
+        print(f"Available sheets in {excel_path.name}:")
+        for i, sheet in enumerate(sheets, 1):
+            print(f"  {i}. {sheet}")
+        sys.exit(0)
+
+    # Import the converter (and with it pandas/reportlab) only once the
+    # arguments are validated, so --help and bad paths stay fast
+    from .converter import ExcelToPDFConverter
+
     try:
         # Initialize converter
         converter = ExcelToPDFConverter(str(excel_path), args.output_dir)
-        
-        # List sheets if requested
-        if args.list_sheets:
-            sheets = converter.get_available_sheets()
-            print(f"Available sheets in {excel_path.name}:")
-            for i, sheet in enumerate(sheets, 1):
-                print(f"  {i}. {sheet}")
-            sys.exit(0)
-        
+
         # Load sheets
         if args.proforma_only:
             logger.info("Loading proforma sheets...")
@@ -135,8 +141,8 @@ def main() -> None:
             max_cols_per_sheet=args.max_cols
         )
         
-        # Success message
-        pdf_size = Path(pdf_path).stat().st_size
+        # Success message; stat once and reuse the size
+        pdf_size = os.path.getsize(pdf_path)
         logger.info(f"✅ PDF generated successfully!")
         logger.info(f"📄 File: {pdf_path}")
         logger.info(f"📊 Size: {pdf_size:,} bytes")
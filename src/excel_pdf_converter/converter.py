@@ -2,7 +2,7 @@
 
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import BinaryIO, Dict, List, Optional, Union
 import pandas as pd
 
 from .excel_reader import ExcelReader
@@ -28,8 +28,8 @@ class ExcelToPDFConverter:
         self.excel_reader = ExcelReader(str(self.excel_file_path))
         self.sheets_data = {}
         
-        logger.info(f"Converter initialized for: {self.excel_file_path}")
-        logger.info(f"Output directory: {self.output_dir}")
+        logger.info("Converter initialized for: %s", self.excel_file_path)
+        logger.info("Output directory: %s", self.output_dir)
     
     def load_sheets(self, sheet_names: Optional[List[str]] = None) -> Dict[str, pd.DataFrame]:
         """Load sheets from the Excel file.
@@ -44,7 +44,7 @@ class ExcelToPDFConverter:
             sheet_names = self.excel_reader.get_sheet_names()
         
         self.sheets_data = self.excel_reader.read_multiple_sheets(sheet_names)
-        logger.info(f"Loaded {len(self.sheets_data)} sheets")
+        logger.info("Loaded %d sheets", len(self.sheets_data))
         return self.sheets_data
     
     def load_proforma_sheets(self) -> Dict[str, pd.DataFrame]:
@@ -54,7 +54,7 @@ class ExcelToPDFConverter:
             Dictionary with proforma sheet data
         """
         self.sheets_data = self.excel_reader.read_proforma_sheets()
-        logger.info(f"Loaded proforma sheets: {list(self.sheets_data.keys())}")
+        logger.info("Loaded proforma sheets: %s", list(self.sheets_data.keys()))
         return self.sheets_data
     
     def get_sheet_info(self) -> Dict[str, Dict[str, any]]:
@@ -68,49 +68,85 @@ class ExcelToPDFConverter:
             sheet_info[sheet_name] = self.excel_reader.get_sheet_info(sheet_name)
         return sheet_info
     
-    def convert_to_pdf(self, pdf_filename: Optional[str] = None, 
+    def convert_to_pdf(self, pdf_filename: Optional[str] = None,
                       include_sheet_summaries: bool = True,
                       max_rows_per_sheet: int = 1000,
-                      max_cols_per_sheet: int = 50) -> str:
-        """Convert loaded sheets to PDF.
-        
+                      max_cols_per_sheet: int = 50,
+                      sheet_names: Optional[List[str]] = None,
+                      output: Optional[BinaryIO] = None) -> Union[str, BinaryIO]:
+        """Convert sheets to PDF.
+
+        Sheets are gathered up front so their cleaning passes can run
+        concurrently, then each frame is released as soon as its
+        flowables have been built.
+
         Args:
             pdf_filename: Name of the output PDF file. If None, uses Excel filename.
             include_sheet_summaries: Whether to include sheet summaries
             max_rows_per_sheet: Maximum rows to display per sheet
             max_cols_per_sheet: Maximum columns to display per sheet
-            
+            sheet_names: Sheets to convert. If None, uses the previously loaded sheets.
+            output: Optional binary file-like object to build the PDF into,
+                skipping the disk round-trip entirely.
+
         Returns:
-            Path to the generated PDF file
+            Path to the generated PDF file, or the output buffer when one
+            was supplied
         """
-        if not self.sheets_data:
-            raise ValueError("No sheets loaded. Call load_sheets() or load_proforma_sheets() first.")
-        
-        # Generate PDF filename if not provided
-        if pdf_filename is None:
-            pdf_filename = f"{self.excel_file_path.stem}_converted.pdf"
-        
-        pdf_path = self.output_dir / pdf_filename
-        
-        # Initialize PDF generator
-        pdf_gen = PDFGenerator(str(pdf_path))
+        if sheet_names is None:
+            if not self.sheets_data:
+                raise ValueError("No sheets loaded. Call load_sheets() or load_proforma_sheets() first.")
+            sheet_names = list(self.sheets_data.keys())
+
+        if output is not None:
+            # Build straight into the caller's buffer
+            pdf_gen = PDFGenerator(output)
+        else:
+            # Generate PDF filename if not provided
+            if pdf_filename is None:
+                pdf_filename = f"{self.excel_file_path.stem}_converted.pdf"
+
+            pdf_path = self.output_dir / pdf_filename
+
+            # Initialize PDF generator
+            pdf_gen = PDFGenerator(str(pdf_path))
         
         # Add title page
         title = f"Proforma Analysis - {self.excel_file_path.stem}"
         pdf_gen.add_title_page(title)
         
-        # Add each sheet
-        sheet_names = list(self.sheets_data.keys())
-        for i, (sheet_name, df) in enumerate(self.sheets_data.items()):
+        # Reuse frames already loaded by load_sheets/load_proforma_sheets
+        # (a full read satisfies any limits once sliced); only sheets not
+        # loaded yet are read, with the display limits pushed down so
+        # rows and columns beyond them are never decoded. The iloc slice
+        # returns a view, not a copy. The generator's clean cache is then
+        # warmed for all sheets concurrently before the single-threaded
+        # flowable build.
+        sliced_sheets = []
+        for sheet_name in sheet_names:
+            df = self.sheets_data.get(sheet_name)
+            if df is None:
+                df = self.excel_reader.read_sheet(
+                    sheet_name, nrows=max_rows_per_sheet,
+                    usecols=max_cols_per_sheet)
+            sliced_sheets.append(
+                (sheet_name, df.iloc[:max_rows_per_sheet, :max_cols_per_sheet]))
+        pdf_gen.clean_sheets_concurrently([df for _, df in sliced_sheets])
+
+        num_sheets = len(sliced_sheets)
+        for i in range(num_sheets):
+            # Pop the frame so the list stops keeping it alive once it
+            # has been rendered
+            sheet_name, df = sliced_sheets.pop(0)
             try:
                 # Add sheet summary if requested
                 if include_sheet_summaries:
                     pdf_gen.add_sheet_summary(sheet_name, df)
-                
-                # Add sheet data
+
+                # Add sheet data; the clean cache was warmed above
                 pdf_gen.add_sheet_data(
-                    sheet_name, 
-                    df, 
+                    sheet_name,
+                    df,
                     max_rows=max_rows_per_sheet,
                     max_cols=max_cols_per_sheet
                 )
@@ -119,17 +155,21 @@ class ExcelToPDFConverter:
                 if i < len(sheet_names) - 1:
                     pdf_gen.add_page_break()
                 
-                logger.info(f"Added sheet '{sheet_name}' to PDF")
+                logger.info("Added sheet '%s' to PDF", sheet_name)
                 
             except Exception as e:
-                logger.error(f"Error processing sheet '{sheet_name}': {e}")
+                logger.error("Error processing sheet '%s': %s", sheet_name, e)
                 # Continue with other sheets
                 continue
-        
+            finally:
+                # Drop the local reference; together with the pop above
+                # the frame is released before the next sheet renders
+                del df
+
         # Add notes section
         notes = [
             f"Generated from: {self.excel_file_path.name}",
-            f"Total sheets processed: {len(self.sheets_data)}",
+            f"Total sheets processed: {len(sheet_names)}",
             f"Maximum rows per sheet: {max_rows_per_sheet}",
             f"Maximum columns per sheet: {max_cols_per_sheet}"
         ]
@@ -137,7 +177,7 @@ class ExcelToPDFConverter:
         
         # Generate PDF
         final_path = pdf_gen.generate_pdf()
-        logger.info(f"PDF conversion completed: {final_path}")
+        logger.info("PDF conversion completed: %s", final_path)
         
         return final_path
     
@@ -164,6 +204,16 @@ class ExcelToPDFConverter:
             max_cols_per_sheet=50     # No practical limit
         )
     
+    def release_sheets(self) -> None:
+        """Drop loaded sheet frames and the reader's sheet cache.
+
+        Long-lived converters (e.g. cached across Streamlit reruns) call
+        this after a conversion so the full-sheet frames do not stay
+        pinned for the rest of the session.
+        """
+        self.sheets_data.clear()
+        self.excel_reader.clear_cache()
+
     def get_available_sheets(self) -> List[str]:
         """Get list of available sheet names in the Excel file.
         
@@ -181,21 +231,22 @@ class ExcelToPDFConverter:
         Returns:
             Dictionary mapping sheet names to validation status
         """
-        available_sheets = self.get_available_sheets()
+        available_sheets = set(self.get_available_sheets())
         validation_results = {}
-        
+
         for sheet_name in sheet_names:
             exists = sheet_name in available_sheets
             has_data = False
-            
+
             if exists:
                 try:
-                    df = self.excel_reader.read_sheet(sheet_name)
-                    has_data = not df.empty
+                    # Dimension metadata answers "is there data?" without
+                    # parsing any cell values
+                    has_data = self.excel_reader.sheet_has_data(sheet_name)
                 except Exception as e:
-                    logger.error(f"Error reading sheet {sheet_name}: {e}")
+                    logger.error("Error reading sheet %s: %s", sheet_name, e)
                     has_data = False
-            
+
             validation_results[sheet_name] = exists and has_data
-        
+
         return validation_results
@@ -1,7 +1,11 @@
 """Excel file reader for proforma documents."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
-from typing import Dict, List, Optional, Tuple
+from python_calamine import CalamineWorkbook
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -9,7 +13,11 @@ logger = logging.getLogger(__name__)
 
 class ExcelReader:
     """Reads Excel files and extracts data from specific sheets."""
-    
+
+    # How many leading rows _find_header_row inspects for the header
+    _HEADER_SCAN_ROWS = 10
+
+
     def __init__(self, file_path: str) -> None:
         """Initialize with Excel file path.
         
@@ -18,16 +26,31 @@ class ExcelReader:
         """
         self.file_path = file_path
         self.workbook = None
+        self._sheet_cache: Dict[Tuple[str, Optional[int]], pd.DataFrame] = {}
+        self._cache_mtime = os.stat(file_path).st_mtime
         self._load_workbook()
     
     def _load_workbook(self) -> None:
-        """Load the Excel workbook."""
+        """Open the Excel workbook for metadata access.
+
+        Opening the workbook reads only the ZIP directory and workbook
+        metadata; no cell data is parsed until a sheet is requested.
+        """
         try:
-            self.workbook = pd.ExcelFile(self.file_path)
-            logger.info(f"Successfully loaded Excel file: {self.file_path}")
+            self.workbook = CalamineWorkbook.from_path(self.file_path)
+            logger.info("Successfully loaded Excel file: %s", self.file_path)
         except Exception as e:
-            logger.error(f"Failed to load Excel file {self.file_path}: {e}")
+            logger.error("Failed to load Excel file %s: %s", self.file_path, e)
             raise
+
+    def __del__(self) -> None:
+        """Release the workbook handle."""
+        try:
+            workbook = getattr(self, 'workbook', None)
+            if workbook is not None:
+                workbook.close()
+        except Exception:
+            pass
     
     def get_sheet_names(self) -> List[str]:
         """Get all sheet names from the workbook.
@@ -37,52 +60,134 @@ class ExcelReader:
         """
         return self.workbook.sheet_names
     
-    def read_sheet(self, sheet_name: str, header_row: Optional[int] = None) -> pd.DataFrame:
+    def read_sheet(self, sheet_name: str, header_row: Optional[int] = None,
+                   nrows: Optional[int] = None,
+                   usecols: Optional[int] = None) -> pd.DataFrame:
         """Read a specific sheet from the workbook.
-        
+
         Args:
             sheet_name: Name of the sheet to read
             header_row: Row number to use as header (0-indexed). If None, auto-detect.
-            
+            nrows: Maximum number of data rows to read. If None, read all rows.
+            usecols: Maximum number of leading columns to read. If None, read all.
+
         Returns:
             DataFrame containing the sheet data
         """
+        # Serve repeat reads from the cache; several callers (sheet info,
+        # validation, data-range detection) ask for the same sheet per run.
+        key = (sheet_name, header_row, nrows, usecols)
+        mtime = os.stat(self.file_path).st_mtime
+        if mtime != self._cache_mtime:
+            self._sheet_cache.clear()
+            self._cache_mtime = mtime
+        if key in self._sheet_cache:
+            return self._sheet_cache[key]
+
         try:
-            # First, read without headers to inspect the structure
-            df_raw = pd.read_excel(
-                self.file_path,
-                sheet_name=sheet_name,
-                header=None,
-                engine='openpyxl'
-            )
-            
-            # Auto-detect header row if not specified
-            if header_row is None:
-                header_row = self._find_header_row(df_raw)
-            
-            # Read with proper headers - read ALL data including calculated values
-            df = pd.read_excel(
-                self.file_path,
-                sheet_name=sheet_name,
-                header=header_row,
-                engine='openpyxl',
-                # Don't skip any rows or columns
-                skiprows=None,
-                skipcols=None,
-                # Read all data
-                nrows=None,
-                usecols=None
-            )
-            
-            # Clean up column names
-            df = self._clean_dataframe_headers(df)
-            
-            logger.info(f"Successfully read sheet: {sheet_name} ({len(df)} rows, {len(df.columns)} columns)")
+            # Read the sheet exactly once, without headers. The calamine
+            # engine (Rust-based) streams the sheet instead of building a
+            # full XML DOM like openpyxl, which is much faster and lighter
+            # on memory for large workbooks. The header row is then applied
+            # in-memory rather than re-parsing the file a second time.
+            # Row/column limits are pushed down so rows beyond them are
+            # never decoded at all; the raw row budget leaves headroom for
+            # the header-detection window above the data.
+            read_kwargs = {}
+            if nrows is not None:
+                read_kwargs['nrows'] = nrows + self._HEADER_SCAN_ROWS + 1
+            if usecols is not None:
+                read_kwargs['usecols'] = range(usecols)
+
+            try:
+                df_raw = pd.read_excel(
+                    self.file_path,
+                    sheet_name=sheet_name,
+                    header=None,
+                    engine='calamine',
+                    **read_kwargs
+                )
+            except pd.errors.ParserError:
+                # pandas rejects usecols indices beyond the parsed sheet
+                # width, and calamine's dimension metadata can understate
+                # that width, so there is no reliable value to clamp
+                # against up front. A rejection means the sheet is
+                # narrower than the limit, so reading every column
+                # satisfies the limit exactly.
+                if 'usecols' not in read_kwargs:
+                    raise
+                del read_kwargs['usecols']
+                df_raw = pd.read_excel(
+                    self.file_path,
+                    sheet_name=sheet_name,
+                    header=None,
+                    engine='calamine',
+                    **read_kwargs
+                )
+
+            df = self._apply_header(df_raw, header_row)
+            if nrows is not None:
+                df = df.head(nrows)
+
+            logger.info("Successfully read sheet: %s (%d rows, %d columns)", sheet_name, len(df), len(df.columns))
+            self._sheet_cache[key] = df
             return df
         except Exception as e:
-            logger.error(f"Failed to read sheet {sheet_name}: {e}")
+            logger.error("Failed to read sheet %s: %s", sheet_name, e)
             raise
     
+    def iter_rows(self, sheet_name: str) -> Iterator[List[Any]]:
+        """Yield raw rows from a sheet without building a DataFrame.
+
+        Reads straight from the calamine workbook, so callers that only
+        need an iterable of rows (e.g. PDF table construction) skip the
+        pandas BlockManager round-trip entirely.
+
+        Args:
+            sheet_name: Name of the sheet to iterate
+
+        Yields:
+            Lists of typed cell values, one list per row
+        """
+        yield from self.workbook.get_sheet_by_name(sheet_name).iter_rows()
+
+    def sheet_has_data(self, sheet_name: str) -> bool:
+        """Check whether a sheet contains any cells without parsing values.
+
+        Uses calamine's sheet dimension metadata, so the answer costs a
+        metadata read instead of a full sheet parse.
+
+        Args:
+            sheet_name: Name of the sheet to check
+
+        Returns:
+            True if the sheet has at least one non-empty cell
+        """
+        sheet = self.workbook.get_sheet_by_name(sheet_name)
+        return sheet.total_height > 0 and sheet.total_width > 0
+
+    def _apply_header(self, df_raw: pd.DataFrame, header_row: Optional[int] = None) -> pd.DataFrame:
+        """Promote a header row of a raw (headerless) DataFrame in-memory.
+
+        Args:
+            df_raw: Raw DataFrame read with header=None
+            header_row: Row number to use as header (0-indexed). If None, auto-detect.
+
+        Returns:
+            DataFrame with headers applied and cleaned
+        """
+        if header_row is None:
+            header_row = self._find_header_row(df_raw)
+
+        # Empty (or shorter-than-header) sheets have no row to promote
+        if header_row >= len(df_raw):
+            return df_raw
+
+        df = df_raw.iloc[header_row + 1:].reset_index(drop=True)
+        df.columns = df_raw.iloc[header_row].tolist()
+
+        return self._clean_dataframe_headers(df)
+
     def _find_header_row(self, df: pd.DataFrame) -> int:
         """Find the best row to use as headers by looking for the row with the most text content.
         
@@ -92,19 +197,18 @@ class ExcelReader:
         Returns:
             Row index to use as header
         """
-        best_row = 0
-        max_text_cells = 0
-        
-        # Check first 10 rows
-        for i in range(min(10, len(df))):
-            row = df.iloc[i]
-            text_cells = sum(1 for cell in row if pd.notna(cell) and str(cell).strip())
-            
-            if text_cells > max_text_cells:
-                max_text_cells = text_cells
-                best_row = i
-        
-        return best_row
+        # Check the leading rows; count non-empty cells per row in one
+        # vectorized pass instead of a Python loop over every cell.
+        head = df.head(self._HEADER_SCAN_ROWS)
+        if head.empty:
+            return 0
+
+        non_empty = head.notna() & head.astype(str).apply(lambda s: s.str.strip() != '')
+        counts = non_empty.sum(axis=1).to_numpy()
+
+        # argmax returns the first row with the highest count, matching the
+        # previous "strictly greater" scan
+        return int(counts.argmax())
     
     def _clean_dataframe_headers(self, df: pd.DataFrame) -> pd.DataFrame:
         """Clean up DataFrame column headers and remove empty rows/columns.
@@ -115,18 +219,39 @@ class ExcelReader:
         Returns:
             Cleaned DataFrame
         """
-        # Clean column names
-        df.columns = [str(col).strip() if pd.notna(col) else f"Column_{i}" 
-                     for i, col in enumerate(df.columns)]
+        # Clean column names with vectorized Index string ops rather than
+        # a Python-level comprehension per column
+        cols = pd.Index(df.columns)
+        missing = cols.isna()
+        cols = cols.astype(str).str.strip()
+        if missing.any():
+            fallback = pd.Index([f"Column_{i}" for i in range(len(cols))])
+            cols = cols.where(~missing, fallback)
+        df.columns = cols
         
         # Remove completely empty rows and columns
         df = df.dropna(how='all').dropna(axis=1, how='all')
-        
+
         # Reset index
         df = df.reset_index(drop=True)
-        
+
+        # Downcast to the smallest sufficient dtypes so less memory moves
+        # through the PDF pipeline. Assign positionally: headers promoted
+        # from data rows may repeat labels (e.g. "Total"), and label-based
+        # assignment raises on duplicates.
+        df = df.convert_dtypes()
+        for i, dtype in enumerate(df.dtypes):
+            if dtype.kind == 'f':
+                df.isetitem(i, pd.to_numeric(df.iloc[:, i], downcast='float'))
+            elif dtype.kind == 'i':
+                df.isetitem(i, pd.to_numeric(df.iloc[:, i], downcast='integer'))
+
         return df
     
+    def clear_cache(self) -> None:
+        """Drop every cached sheet frame so its memory can be reclaimed."""
+        self._sheet_cache.clear()
+
     def read_multiple_sheets(self, sheet_names: List[str]) -> Dict[str, pd.DataFrame]:
         """Read multiple sheets at once.
         
@@ -136,10 +261,16 @@ class ExcelReader:
         Returns:
             Dictionary mapping sheet names to DataFrames
         """
-        sheets_data = {}
-        for sheet_name in sheet_names:
-            sheets_data[sheet_name] = self.read_sheet(sheet_name)
-        return sheets_data
+        if not sheet_names:
+            return {}
+
+        # Sheets are independent parts of the XLSX ZIP and the calamine
+        # engine releases the GIL while parsing, so reading them in a
+        # thread pool overlaps the per-sheet parse work.
+        max_workers = min(len(sheet_names), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            frames = executor.map(self.read_sheet, sheet_names)
+            return dict(zip(sheet_names, frames))
     
     def get_sheet_info(self, sheet_name: str) -> Dict[str, any]:
         """Get information about a specific sheet.
@@ -161,40 +292,9 @@ class ExcelReader:
                 'data_types': df.dtypes.to_dict()
             }
         except Exception as e:
-            logger.error(f"Failed to get info for sheet {sheet_name}: {e}")
+            logger.error("Failed to get info for sheet %s: %s", sheet_name, e)
             return {'name': sheet_name, 'error': str(e)}
     
-    def find_data_range(self, sheet_name: str) -> Tuple[int, int, int, int]:
-        """Find the actual data range in a sheet (excluding empty rows/columns).
-        
-        Args:
-            sheet_name: Name of the sheet
-            
-        Returns:
-            Tuple of (start_row, end_row, start_col, end_col)
-        """
-        df = self.read_sheet(sheet_name)
-        
-        # Remove completely empty rows and columns
-        df_clean = df.dropna(how='all').dropna(axis=1, how='all')
-        
-        if df_clean.empty:
-            return (0, 0, 0, 0)
-        
-        # Find non-empty cells
-        mask = df_clean.notna()
-        
-        # Get the bounds of non-empty data
-        rows_with_data = mask.any(axis=1)
-        cols_with_data = mask.any(axis=0)
-        
-        start_row = rows_with_data.idxmax() if rows_with_data.any() else 0
-        end_row = rows_with_data[::-1].idxmax() if rows_with_data.any() else 0
-        start_col = cols_with_data.idxmax() if cols_with_data.any() else 0
-        end_col = cols_with_data[::-1].idxmax() if cols_with_data.any() else 0
-        
-        return (start_row, end_row, start_col, end_col)
-    
     def read_proforma_sheets(self) -> Dict[str, pd.DataFrame]:
         """Read the specific proforma sheets that are having printing issues.
         
@@ -213,8 +313,8 @@ class ExcelReader:
         
         if not found_sheets:
             logger.warning("None of the target proforma sheets found. Available sheets:")
-            logger.warning(f"Available sheets: {available_sheets}")
+            logger.warning("Available sheets: %s", available_sheets)
             return {}
         
-        logger.info(f"Found proforma sheets: {found_sheets}")
+        logger.info("Found proforma sheets: %s", found_sheets)
         return self.read_multiple_sheets(found_sheets)
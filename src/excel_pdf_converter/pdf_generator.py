@@ -4,25 +4,111 @@ from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter, A4, landscape
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
+from reportlab.platypus import SimpleDocTemplate, LongTable, Table, TableStyle, Paragraph, Spacer, PageBreak
 from reportlab.platypus.flowables import KeepTogether
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+from reportlab.pdfgen import canvas
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional, Tuple, Any
+
+try:
+    import polars as pl
+except ImportError:  # polars is an optional accelerator
+    pl = None
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, Tuple, Union
 import logging
+import os
+import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Matches (optionally negative) integers, decimals and exponent notation -
+# the same values pd.to_numeric accepts in the vectorized cleaner; anything
+# else skips the numeric-formatting branch without exception machinery
+_NUMERIC_RE = re.compile(r'^-?(?:\d+(?:\.\d+)?|\.\d+)(?:[eE][+-]?\d+)?$')
+
+# Shared table style; the -1 sentinels make it size-independent, so one
+# instance serves every table instead of rebuilding the command list
+_TABLE_STYLE = TableStyle([
+    # Header row styling
+    ('BACKGROUND', (0, 0), (-1, 0), colors.lightblue),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 8),
+
+    # Data rows styling
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 7),
+
+    # Borders
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+
+    # Alternating row colors
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
+])
+
+
+@lru_cache(maxsize=1)
+def _get_base_styles():
+    """Build the ReportLab sample stylesheet once per process."""
+    return getSampleStyleSheet()
+
+
+@lru_cache(maxsize=1)
+def _get_custom_styles() -> Dict[str, ParagraphStyle]:
+    """Build the shared custom paragraph styles once per process."""
+    base = _get_base_styles()
+    return {
+        'title': ParagraphStyle(
+            'CustomTitle',
+            parent=base['Heading1'],
+            fontSize=16,
+            spaceAfter=12,
+            alignment=TA_CENTER,
+            textColor=colors.darkblue
+        ),
+        'sheet_header': ParagraphStyle(
+            'SheetHeader',
+            parent=base['Heading2'],
+            fontSize=14,
+            spaceAfter=8,
+            spaceBefore=12,
+            textColor=colors.darkblue,
+            borderWidth=1,
+            borderColor=colors.grey,
+            borderPadding=6
+        ),
+        'cell': ParagraphStyle(
+            'CellStyle',
+            parent=base['Normal'],
+            fontSize=8,
+            alignment=TA_LEFT
+        ),
+        'number': ParagraphStyle(
+            'NumberStyle',
+            parent=base['Normal'],
+            fontSize=8,
+            alignment=TA_RIGHT
+        ),
+    }
+
 
 class PDFGenerator:
     """Generates professional PDF documents from Excel data."""
     
-    def __init__(self, output_path: str, page_size: Tuple[int, int] = None) -> None:
+    def __init__(self, output_path: Union[str, BinaryIO],
+                 page_size: Tuple[int, int] = None) -> None:
         """Initialize PDF generator.
-        
+
         Args:
-            output_path: Path where PDF will be saved
+            output_path: Path where PDF will be saved, or a binary
+                file-like object to build the PDF into directly
             page_size: Page size tuple (width, height) in points. If None, auto-detect based on content.
         """
         self.output_path = output_path
@@ -35,50 +121,24 @@ class PDFGenerator:
             topMargin=0.5*inch,
             bottomMargin=0.3*inch
         )
-        self.styles = getSampleStyleSheet()
+        self.styles = _get_base_styles()
         self._setup_custom_styles()
         self.story = []
+        # Small LRU of cleaned frames keyed by DataFrame identity, so the
+        # same frame isn't re-scanned when added more than once
+        self._clean_cache: "OrderedDict[Tuple[int, Tuple[int, int]], pd.DataFrame]" = OrderedDict()
     
     def _setup_custom_styles(self) -> None:
-        """Set up custom paragraph styles for the PDF."""
-        # Title style
-        self.title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=self.styles['Heading1'],
-            fontSize=16,
-            spaceAfter=12,
-            alignment=TA_CENTER,
-            textColor=colors.darkblue
-        )
-        
-        # Sheet header style
-        self.sheet_header_style = ParagraphStyle(
-            'SheetHeader',
-            parent=self.styles['Heading2'],
-            fontSize=14,
-            spaceAfter=8,
-            spaceBefore=12,
-            textColor=colors.darkblue,
-            borderWidth=1,
-            borderColor=colors.grey,
-            borderPadding=6
-        )
-        
-        # Data cell style
-        self.cell_style = ParagraphStyle(
-            'CellStyle',
-            parent=self.styles['Normal'],
-            fontSize=8,
-            alignment=TA_LEFT
-        )
-        
-        # Number cell style
-        self.number_style = ParagraphStyle(
-            'NumberStyle',
-            parent=self.styles['Normal'],
-            fontSize=8,
-            alignment=TA_RIGHT
-        )
+        """Attach the process-wide custom paragraph styles.
+
+        Styles are immutable once built, so every generator instance
+        shares the cached singletons instead of re-allocating them.
+        """
+        custom = _get_custom_styles()
+        self.title_style = custom['title']
+        self.sheet_header_style = custom['sheet_header']
+        self.cell_style = custom['cell']
+        self.number_style = custom['number']
     
     def add_title_page(self, title: str = "Proforma Financial Analysis") -> None:
         """Add a title page to the PDF.
@@ -96,56 +156,184 @@ class PDFGenerator:
         self.story.append(timestamp_para)
         self.story.append(Spacer(1, 0.5*inch))
     
-    def _clean_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _clean_dataframe(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, np.ndarray]:
         """Clean and prepare DataFrame for PDF display.
-        
+
+        Cleaning and column-width measurement are fused into the same
+        column pass so the grid is only scanned once.
+
         Args:
             df: Input DataFrame
-            
+
         Returns:
-            Cleaned DataFrame
+            Tuple of (cleaned DataFrame, per-column max display lengths)
         """
-        # Replace NaN values with empty strings
-        df_clean = df.fillna('')
-        
-        # Convert all values to strings for consistent formatting
-        df_clean = df_clean.astype(str)
-        
-        # Clean up cell values
-        for col in df_clean.columns:
-            df_clean[col] = df_clean[col].apply(self._clean_cell_value)
-        
-        return df_clean
+        key = (id(df), df.shape)
+        cached = self._clean_cache.get(key)
+        if cached is not None:
+            self._clean_cache.move_to_end(key)
+            return cached
+
+        result = None
+        if pl is not None:
+            try:
+                result = self._clean_dataframe_polars(df)
+            except Exception as e:
+                logger.debug("Polars cleaning failed, falling back to pandas: %s", e)
+
+        if result is None:
+            # Clean each column with vectorized string/numeric kernels instead
+            # of a Python-level apply per cell; iterate positionally so
+            # duplicate column names are handled correctly
+            df_clean = df.copy()
+            max_lens = np.zeros(df_clean.shape[1], dtype=float)
+            for i in range(df_clean.shape[1]):
+                cleaned = self._clean_series(df_clean.iloc[:, i])
+                df_clean.isetitem(i, cleaned)
+                if len(cleaned):
+                    max_lens[i] = float(cleaned.str.len().max())
+            result = (df_clean, max_lens)
+
+        self._clean_cache[key] = result
+        if len(self._clean_cache) > 8:
+            self._clean_cache.popitem(last=False)
+
+        return result
+
+    def clean_sheets_concurrently(self, frames: List[pd.DataFrame]) -> None:
+        """Warm the clean cache for several frames in parallel.
+
+        Cleaning is dominated by pandas/polars kernels that release the
+        GIL, so the per-sheet passes overlap across threads; the flowable
+        build that follows stays single-threaded and hits the cache.
+
+        Args:
+            frames: The exact DataFrame objects that will later be passed
+                to add_sheet_data (the cache is keyed by identity)
+        """
+        if len(frames) < 2:
+            return
+
+        max_workers = min(len(frames), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(self._clean_dataframe, frames))
+
+    def _clean_dataframe_polars(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, np.ndarray]:
+        """Clean a DataFrame with polars' multi-threaded string kernels.
+
+        Same semantics as the pandas path, but the numeric/truncate logic
+        runs as one Rust expression per column without the GIL.
+
+        Args:
+            df: Input DataFrame
+
+        Returns:
+            Tuple of (cleaned DataFrame with the original column labels,
+            per-column max display lengths)
+        """
+        # Rename positionally so duplicate column labels survive the trip,
+        # and stringify mixed object columns so Arrow can carry them over
+        names = [f"column_{i}" for i in range(df.shape[1])]
+        prepared = df.set_axis(names, axis=1)
+        object_cols = prepared.columns[prepared.dtypes == object]
+        if len(object_cols):
+            prepared[object_cols] = prepared[object_cols].astype('string')
+        frame = pl.from_pandas(prepared)
+
+        exprs = []
+        for name in names:
+            s = pl.col(name).cast(pl.Utf8).fill_null("").str.strip_chars()
+            s = pl.when(s == "nan").then(pl.lit("")).otherwise(s)
+            num = s.cast(pl.Float64, strict=False)
+            # The finiteness and int64-range guards keep values the
+            # strict Int64 cast would reject (or wrap) on the text path,
+            # matching the pandas cleaner
+            in_range = num.is_not_null() & num.is_finite() & (num.abs() < 2 ** 63)
+            exprs.append(
+                pl.when(in_range & (num == num.round(0)))
+                .then(num.cast(pl.Int64).cast(pl.Utf8))
+                .when(in_range)
+                .then(num.round(2).cast(pl.Utf8))
+                .when(s.str.len_chars() > 40)
+                .then(s.str.slice(0, 40) + pl.lit("..."))
+                .otherwise(s)
+                .alias(name)
+            )
+
+        cleaned = frame.select(exprs)
+        max_lens = np.asarray(
+            cleaned.select(pl.col(name).str.len_chars().max() for name in names).row(0),
+            dtype=float
+        )
+        max_lens = np.nan_to_num(max_lens)
+
+        df_clean = cleaned.to_pandas().astype(str)
+        df_clean.columns = df.columns
+        df_clean.index = df.index
+        return df_clean, max_lens
+
+    def _clean_series(self, series: pd.Series) -> pd.Series:
+        """Vectorized equivalent of _clean_cell_value for a whole column.
+
+        Args:
+            series: Input column
+
+        Returns:
+            Column of cleaned display strings
+        """
+        s = series.astype('string').fillna('').str.strip()
+        s = s.mask(s == 'nan', '')
+
+        # Numeric formatting: integral values lose their decimals, other
+        # numbers are rounded to two places. Infinities and magnitudes
+        # beyond int64 fall through to the text path - casting either to
+        # Int64 wraps silently.
+        num = pd.to_numeric(s.replace('', pd.NA), errors='coerce')
+        in_range = (num.notna() & ~num.isin([np.inf, -np.inf])
+                    & (num.abs() < 2 ** 63)).fillna(False)
+        is_int = (in_range & (num == num.round())).fillna(False)
+        is_float = in_range & ~is_int
+
+        # Everything on the text path gets the 40-character display cap
+        too_long = ~in_range & (s.str.len() > 40)
+        s = s.mask(too_long, s.str.slice(0, 40) + '...')
+        s = s.mask(is_int, num.round().astype('Int64').astype('string'))
+        s = s.mask(is_float, num.round(2).astype('string'))
+
+        return s.astype(str)
     
     def _clean_cell_value(self, value: str) -> str:
         """Clean individual cell values for better PDF display.
-        
+
+        Scalar twin of _clean_series for the raw-row path; keeps the
+        same formatting so both paths render a value identically.
+
         Args:
             value: Cell value as string
-            
+
         Returns:
             Cleaned cell value
         """
         if not value or value == 'nan':
             return ''
-        
+
         # Remove extra whitespace
         value = str(value).strip()
-        
-        # Handle numbers with proper formatting
-        try:
-            # Try to format as number if it's numeric
-            if '.' in value:
-                num = float(value)
-                if num == int(num):
-                    return str(int(num))
-                return f"{num:.2f}"
-            else:
-                num = int(value)
-                return str(num)
-        except (ValueError, TypeError):
-            # Not a number, return as string with length limit
+
+        # Most cells are labels; one regex match decides the path without
+        # paying for a raised-and-caught ValueError per non-numeric cell
+        if not _NUMERIC_RE.match(value):
             return value[:40] + '...' if len(value) > 40 else value
+
+        # Numeric formatting: integral values lose their decimals, other
+        # numbers are rounded to two places; infinities and magnitudes
+        # beyond int64 stay as text
+        num = float(value)
+        if not np.isfinite(num) or abs(num) >= 2 ** 63:
+            return value[:40] + '...' if len(value) > 40 else value
+        if num == round(num):
+            return str(int(num))
+        return str(round(num, 2))
     
     def _create_table_from_dataframe(self, df: pd.DataFrame, max_rows: int = 1000) -> Table:
         """Create a ReportLab Table from a pandas DataFrame.
@@ -157,64 +345,58 @@ class PDFGenerator:
         Returns:
             ReportLab Table object
         """
-        df_clean = self._clean_dataframe(df)
-        
         # Log original size
-        original_rows = len(df_clean)
-        logger.info(f"Creating table from {original_rows} rows, {len(df_clean.columns)} columns")
-        
-        # Only limit rows if absolutely necessary for PDF generation
-        if len(df_clean) > max_rows:
+        original_rows = len(df)
+        logger.info(f"Creating table from {original_rows} rows, {len(df.columns)} columns")
+
+        # Truncate before cleaning so the expensive per-cell pass only
+        # touches rows that will actually render
+        if original_rows > max_rows:
             logger.warning(f"Large dataset: {original_rows} rows. Consider increasing max_rows if data is truncated.")
-            df_clean = df_clean.head(max_rows)
+            df = df.head(max_rows)
             logger.warning(f"DataFrame truncated to {max_rows} rows for PDF display (was {original_rows} rows)")
         else:
             logger.info(f"Including all {original_rows} rows in PDF")
-        
-        # Prepare table data
+
+        df_clean, col_max_lens = self._clean_dataframe(df)
+
+        # Prepare table data in one pre-allocated object array (header +
+        # grid) rather than growing a list row by row; _clean_dataframe
+        # already cast every cell to str, so no per-cell str() is needed
         table_data = []
-        
-        # Add header row
+
         if not df_clean.empty:
-            headers = [str(col) for col in df_clean.columns]
-            table_data.append(headers)
-            
-            # Add data rows
-            for _, row in df_clean.iterrows():
-                row_data = [str(cell) for cell in row.values]
-                table_data.append(row_data)
-        
-        # Create table with repeatRows for headers
-        table = Table(table_data, repeatRows=1)
-        
+            arr = np.empty((len(df_clean) + 1, len(df_clean.columns)), dtype=object)
+            arr[0] = df_clean.columns.astype(str).to_numpy()
+            arr[1:] = df_clean.to_numpy(dtype=object, copy=False)
+            table_data = arr.tolist()
+
+        return self._build_table(table_data, col_max_lens=col_max_lens)
+
+    def _build_table(self, table_data: List[List[str]],
+                     col_max_lens: Optional[np.ndarray] = None) -> Table:
+        """Build a styled ReportLab Table from prepared rows of strings.
+
+        Args:
+            table_data: Table rows (header first) as lists of strings
+            col_max_lens: Per-column max cell lengths measured during
+                cleaning, if available, so the width pass is skipped
+
+        Returns:
+            Styled ReportLab Table object
+        """
+        # Create table with repeatRows for headers; LongTable splits in
+        # O(rows) rather than Table's quadratic splitter, and fixed row
+        # heights mean the splitter never has to re-measure a row (cells
+        # stay single-line plain strings, already capped at 40 chars)
+        table = LongTable(table_data, repeatRows=1, splitByRow=1,
+                          rowHeights=[14] * len(table_data))
+
         # Calculate column widths based on content
-        col_widths = self._calculate_column_widths(table_data)
-        
-        # Style the table
-        table_style = TableStyle([
-            # Header row styling
-            ('BACKGROUND', (0, 0), (-1, 0), colors.lightblue),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 8),
-            
-            # Data rows styling
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 7),
-            
-            # Borders
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            
-            # Alternating row colors
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
-            
-            # Wrap text in cells
-            ('WORDWRAP', (0, 0), (-1, -1), 'CJK'),
-        ])
-        
-        table.setStyle(table_style)
+        col_widths = self._calculate_column_widths(table_data, col_max_lens)
+
+        # Style the table with the shared precompiled style
+        table.setStyle(_TABLE_STYLE)
         
         # Apply column widths if calculated
         if col_widths:
@@ -222,38 +404,57 @@ class PDFGenerator:
         
         return table
     
-    def _calculate_column_widths(self, table_data: List[List[str]]) -> List[float]:
+    def _calculate_column_widths(self, table_data: List[List[str]],
+                                 col_max_lens: Optional[np.ndarray] = None) -> List[float]:
         """Calculate appropriate column widths based on content.
-        
+
         Args:
             table_data: Table data as list of rows
-            
+            col_max_lens: Per-column max cell lengths already measured
+                during cleaning; when given, only the header row is scanned
+
         Returns:
             List of column widths in points
         """
         if not table_data:
             return []
-        
+
+        # Set reasonable limits for landscape mode
+        min_width = 80  # Minimum column width
+        max_width = 200  # Maximum column width
+
+        if col_max_lens is not None and len(col_max_lens) == len(table_data[0]):
+            # Cell lengths came for free with cleaning; only measure headers
+            header_widths = np.fromiter((len(str(h)) for h in table_data[0]), dtype=float)
+            max_widths = np.maximum(np.nan_to_num(col_max_lens), header_widths) * 6
+            return np.clip(max_widths, min_width, max_width).tolist()
+
         num_cols = len(table_data[0])
+
+        if all(len(row) == num_cols for row in table_data):
+            # Rectangular data: compute every cell length in one ufunc pass
+            # and reduce per column in NumPy's C loop
+            lens = np.frompyfunc(len, 1, 1)(
+                np.asarray(table_data, dtype=object)
+            ).astype(np.int64)
+            max_widths = lens.max(axis=0) * 6  # Approximate character width
+            return np.clip(max_widths, min_width, max_width).astype(float).tolist()
+
+        # Ragged rows (raw calamine output): fall back to the Python scan
         max_widths = [0] * num_cols
-        
-        # Find maximum width for each column
+
         for row in table_data:
             for i, cell in enumerate(row):
                 if i < num_cols:
                     cell_width = len(str(cell)) * 6  # Approximate character width
                     max_widths[i] = max(max_widths[i], cell_width)
-        
-        # Set reasonable limits for landscape mode
-        min_width = 80  # Minimum column width
-        max_width = 200  # Maximum column width
-        
+
         # Apply limits and convert to points
         col_widths = []
         for width in max_widths:
             width = max(min_width, min(width, max_width))
             col_widths.append(width)
-        
+
         return col_widths
     
     def add_sheet_data(self, sheet_name: str, df: pd.DataFrame, 
@@ -313,6 +514,42 @@ class PDFGenerator:
                                     self.styles['Normal'])
                 self.story.append(error_msg)
     
+    def add_sheet_rows(self, sheet_name: str, header: List[Any],
+                       rows: Iterable[List[Any]], max_rows: int = 1000) -> None:
+        """Add a sheet's data to the PDF from raw rows, bypassing pandas.
+
+        Args:
+            sheet_name: Name of the sheet
+            header: Header row as a list of values
+            rows: Iterable of data rows (lists of cell values)
+            max_rows: Maximum number of rows to display
+        """
+        # Add sheet header
+        sheet_header = Paragraph(f"<b>{sheet_name}</b>", self.sheet_header_style)
+        self.story.append(sheet_header)
+
+        table_data = [[str(cell) for cell in header]]
+        for i, row in enumerate(rows):
+            if i >= max_rows:
+                logger.warning(f"Sheet '{sheet_name}' truncated to {max_rows} rows for PDF display")
+                break
+            table_data.append([self._clean_cell_value(str(cell)) for cell in row])
+
+        if len(table_data) == 1:
+            empty_msg = Paragraph("No data available in this sheet.", self.styles['Normal'])
+            self.story.append(empty_msg)
+            self.story.append(Spacer(1, 0.2*inch))
+            return
+
+        try:
+            self.story.append(self._build_table(table_data))
+            self.story.append(Spacer(1, 0.2*inch))
+        except Exception as e:
+            logger.error(f"Error creating table for sheet {sheet_name}: {e}")
+            error_msg = Paragraph(f"Error displaying data for {sheet_name}: {str(e)}",
+                                self.styles['Normal'])
+            self.story.append(error_msg)
+
     def add_sheet_summary(self, sheet_name: str, df: pd.DataFrame) -> None:
         """Add a summary of the sheet data.
         
@@ -322,12 +559,18 @@ class PDFGenerator:
         """
         if df.empty:
             return
-        
+
+        num_rows = len(df)
+        num_cols = len(df.columns)
+        # Deduplicate dtype names directly on the dtype objects; no
+        # intermediate string Series needed
+        dtypes_str = ', '.join(sorted({dtype.name for dtype in df.dtypes}))
+
         summary_text = f"""
         <b>{sheet_name} Summary:</b><br/>
-        • Rows: {len(df)}<br/>
-        • Columns: {len(df.columns)}<br/>
-        • Data Types: {', '.join(df.dtypes.astype(str).unique())}<br/>
+        • Rows: {num_rows}<br/>
+        • Columns: {num_cols}<br/>
+        • Data Types: {dtypes_str}<br/>
         """
         
         summary_para = Paragraph(summary_text, self.styles['Normal'])
@@ -338,14 +581,22 @@ class PDFGenerator:
         """Add a page break to the PDF."""
         self.story.append(PageBreak())
     
-    def generate_pdf(self) -> str:
+    def generate_pdf(self) -> Union[str, BinaryIO]:
         """Generate the final PDF document.
-        
+
         Returns:
-            Path to the generated PDF file
+            Path to the generated PDF file, or the output buffer when the
+            generator was created with a file-like object
         """
         try:
-            self.doc.build(self.story)
+            # Hand the story off and drop our own references first;
+            # ReportLab pops flowables from the list as it renders them,
+            # so tables are freed page by page instead of staying alive
+            # until the generator itself is collected
+            story = self.story
+            self.story = []
+            self.doc.build(story)
+            self._clean_cache.clear()
             logger.info(f"PDF successfully generated: {self.output_path}")
             return self.output_path
         except Exception as e:
@@ -367,5 +618,105 @@ class PDFGenerator:
         for note in notes:
             note_para = Paragraph(f"• {note}", self.styles['Normal'])
             self.story.append(note_para)
-        
+
         self.story.append(Spacer(1, 0.2*inch))
+
+
+class FastPDFGenerator:
+    """Canvas-based generator for tabular-only output.
+
+    Bypasses ReportLab's flowable and splitter machinery entirely: rows
+    are drawn with drawString in a simple pagination loop, so per-cell
+    work stays constant no matter how many rows a sheet has. Trades the
+    styled tables of PDFGenerator for raw throughput.
+    """
+
+    def __init__(self, output_path: Union[str, BinaryIO],
+                 page_size: Tuple[int, int] = None) -> None:
+        """Initialize the canvas generator.
+
+        Args:
+            output_path: Path where PDF will be saved, or a binary
+                file-like object to build the PDF into directly
+            page_size: Page size tuple (width, height) in points
+        """
+        self.output_path = output_path
+        self.page_size = page_size or landscape(letter)
+        self.canvas = canvas.Canvas(output_path, pagesize=self.page_size)
+        self._margin = 0.3 * inch
+        self._row_height = 11
+        self._font_size = 7
+
+    def add_title_page(self, title: str = "Proforma Financial Analysis") -> None:
+        """Draw a title page.
+
+        Args:
+            title: Title of the document
+        """
+        width, height = self.page_size
+        self.canvas.setFont('Helvetica-Bold', 16)
+        self.canvas.drawCentredString(width / 2, height - 1.5 * inch, title)
+
+        timestamp = datetime.now().strftime("%B %d, %Y at %I:%M %p")
+        self.canvas.setFont('Helvetica', 10)
+        self.canvas.drawCentredString(width / 2, height - 1.8 * inch,
+                                      f"Generated on: {timestamp}")
+        self.canvas.showPage()
+
+    def add_sheet_data(self, sheet_name: str, df: pd.DataFrame,
+                       max_rows: int = 1000, max_cols: int = 50) -> None:
+        """Draw a sheet as plain text rows with header repetition per page.
+
+        Args:
+            sheet_name: Name of the sheet
+            df: DataFrame containing the sheet data
+            max_rows: Maximum number of rows to display
+            max_cols: Maximum number of columns to display
+        """
+        df = df.iloc[:max_rows, :max_cols]
+        width, height = self.page_size
+
+        # Fixed-width columns sized to fill the printable area; cells are
+        # clipped to what fits rather than reflowed
+        num_cols = max(len(df.columns), 1)
+        col_width = (width - 2 * self._margin) / num_cols
+        max_chars = max(int(col_width // 5), 1)
+
+        headers = [str(col)[:max_chars] for col in df.columns]
+        rows = (df.astype(object).where(df.notna(), '').astype(str)
+                .to_numpy(dtype=object).tolist())
+
+        self._y = height - self._margin - self._row_height
+        self.canvas.setFont('Helvetica-Bold', 10)
+        self.canvas.drawString(self._margin, self._y, sheet_name)
+        self._y -= 1.5 * self._row_height
+
+        self._draw_row(headers, 'Helvetica-Bold')
+        for row in rows:
+            if self._y < self._margin:
+                self.canvas.showPage()
+                self._y = height - self._margin - self._row_height
+                self._draw_row(headers, 'Helvetica-Bold')
+            self._draw_row([value[:max_chars] for value in row], 'Helvetica')
+
+        self.canvas.showPage()
+
+    def _draw_row(self, values: List[str], font_name: str) -> None:
+        """Draw one row of cell strings at the current y position."""
+        self.canvas.setFont(font_name, self._font_size)
+        x = self._margin
+        col_width = (self.page_size[0] - 2 * self._margin) / max(len(values), 1)
+        for value in values:
+            self.canvas.drawString(x, self._y, value)
+            x += col_width
+        self._y -= self._row_height
+
+    def add_page_break(self) -> None:
+        """Start a new page (sheets already end with one; kept for API parity)."""
+        self.canvas.showPage()
+
+    def generate_pdf(self) -> Union[str, BinaryIO]:
+        """Write the PDF and return the output path or buffer."""
+        self.canvas.save()
+        logger.info(f"PDF successfully generated: {self.output_path}")
+        return self.output_path
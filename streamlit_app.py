@@ -1,15 +1,17 @@
 """Streamlit web application for Excel to PDF conversion."""
 
+import gc
+import io
+
 import streamlit as st
-import pandas as pd
-from pathlib import Path
 import logging
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 import os
 
-# Import our converter modules
-from src.excel_pdf_converter.converter import ExcelToPDFConverter
-from src.excel_pdf_converter.excel_reader import ExcelReader
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from src.excel_pdf_converter.converter import ExcelToPDFConverter
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -18,6 +20,117 @@ logger = logging.getLogger(__name__)
 # Path to the Excel file in the project folder
 EXCEL_FILE_PATH = "Pro Forma (4 Products).xlsx"
 
+# The proforma sheets the PDF targets, in display order; the frozenset
+# backs membership checks against the workbook's sheet list
+_PROFORMA_ORDER = ("Assumptions", "Proforma", "Proforma Condensed", "Calculations")
+_PROFORMA = frozenset(_PROFORMA_ORDER)
+
+
+@st.cache_resource(max_entries=4)
+def _get_converter(file_path: str, mtime: float) -> "ExcelToPDFConverter":
+    """Build (or reuse) the converter for the given file and mtime.
+
+    The mtime argument keys the cache so the converter is rebuilt when
+    the Excel file changes on disk; max_entries bounds the cache if the
+    app is ever pointed at several workbooks. The converter stack
+    (pandas, reportlab) is imported here, after the landing page has
+    rendered, so cold starts do not pay for it up front.
+    """
+    from src.excel_pdf_converter.converter import ExcelToPDFConverter
+
+    return ExcelToPDFConverter(file_path)
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _get_available_sheets(file_path: str, mtime: float) -> List[str]:
+    """List sheet names, cached so slider reruns skip the workbook open."""
+    return _get_converter(file_path, mtime).get_available_sheets()
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _validate_sheets(file_path: str, mtime: float,
+                     sheet_names: Tuple[str, ...]) -> Dict[str, bool]:
+    """Validate sheets, cached per (file, mtime, sheet tuple).
+
+    Widget reruns reuse the cached result instead of re-checking sheet
+    dimensions against the workbook on every interaction.
+    """
+    return _get_converter(file_path, mtime).validate_sheets(list(sheet_names))
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _load_preview(file_path: str, sheet_name: str,
+                  mtime: float) -> Tuple[Tuple[int, int], str, "pd.DataFrame"]:
+    """Load what the preview actually displays, cached across reruns.
+
+    Reads only the first 10 rows with the calamine engine and takes the
+    full sheet dimensions from calamine's metadata, so preview cost is
+    O(10 rows) regardless of sheet size. Keyed by (path, sheet, mtime)
+    so slider/checkbox reruns hit the cache instead of re-parsing the
+    workbook.
+    """
+    import pandas as pd
+    from python_calamine import CalamineWorkbook
+
+    sheet = CalamineWorkbook.from_path(file_path).get_sheet_by_name(sheet_name)
+
+    head = pd.read_excel(file_path, sheet_name=sheet_name, nrows=10,
+                         engine='calamine')
+    # Row count comes from calamine metadata (the head only covers 10
+    # rows), but the column count comes from the parsed frame - the
+    # metadata width can understate it and disagree with the table below
+    shape = (sheet.total_height, head.shape[1])
+    # A plain set over the dtype objects avoids the Series astype +
+    # unique round-trip just to join a handful of names
+    dtypes_str = ', '.join(sorted({str(t) for t in head.dtypes.to_numpy()}))
+    return shape, dtypes_str, head
+
+@st.fragment
+def _render_preview_tab(sheet_name: str, valid: bool, mtime: float) -> None:
+    """Render one sheet's preview inside an isolated fragment.
+
+    Toggling the preview checkbox reruns only this tab's fragment, not
+    the whole page, so the converter setup, validation and the other
+    tabs stay untouched.
+    """
+    if not valid:
+        st.error("Sheet not found or has no data.")
+        return
+
+    # Only read the sheet once the user asks for the preview; unopened
+    # previews stay free
+    if st.checkbox("Show preview", key=f"open_{sheet_name}"):
+        try:
+            # Load preview data (cached across reruns)
+            shape, dtypes_str, head = _load_preview(
+                EXCEL_FILE_PATH, sheet_name, mtime)
+
+            st.write(f"**Dimensions:** {shape[0]} rows × {shape[1]} columns")
+            st.write(f"**Data Types:** {dtypes_str}")
+
+            # Show preview
+            if not head.empty:
+                st.write("**Preview (first 10 rows):**")
+                st.dataframe(head, use_container_width=True)
+            else:
+                st.warning("This sheet is empty.")
+
+        except Exception as e:
+            st.error(f"Error reading sheet: {e}")
+
+
+def _render_previews(selected_sheets: List[str],
+                     validation_results: Dict[str, bool],
+                     mtime: float) -> None:
+    """Render one tab per sheet, each backed by its own lazy fragment."""
+    tabs = st.tabs([f"📊 {sheet_name}" for sheet_name in selected_sheets])
+    for sheet_name, tab in zip(selected_sheets, tabs):
+        with tab:
+            _render_preview_tab(sheet_name,
+                                validation_results.get(sheet_name, False),
+                                mtime)
+
+
 # Page configuration
 st.set_page_config(
     page_title="Excel to PDF Converter",
@@ -26,8 +139,8 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for better styling
-st.markdown("""
+# Custom CSS for better styling; emitted at the top of main()
+_CSS = """
 <style>
     .main-header {
         font-size: 3rem;
@@ -56,11 +169,15 @@ st.markdown("""
         border: 1px solid #f5c6cb;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
 
 def main():
     """Main Streamlit application."""
-    
+
+    # Styling must be re-emitted every run - Streamlit drops elements
+    # that are not part of the current script run
+    st.markdown(_CSS, unsafe_allow_html=True)
+
     # Header
     st.markdown('<h1 class="main-header">📊 Proforma PDF Generator</h1>', unsafe_allow_html=True)
     st.markdown("""
@@ -74,8 +191,10 @@ def main():
         st.info("Please ensure 'Pro Forma (4 Products).xlsx' is in the project folder.")
         return
     
-    # Show file info
-    file_size = os.path.getsize(EXCEL_FILE_PATH)
+    # Stat the workbook once per rerun and reuse the results everywhere
+    stat = os.stat(EXCEL_FILE_PATH)
+    file_size = stat.st_size
+    mtime = stat.st_mtime
     st.success(f"✅ Found Excel file: {EXCEL_FILE_PATH} ({file_size:,} bytes)")
     
     # Sidebar for settings
@@ -113,31 +232,31 @@ def main():
             help="Name for the generated PDF file"
         )
     
-    # Initialize converter with the project Excel file
+    # Initialize converter with the project Excel file (cached across reruns)
     try:
-        converter = ExcelToPDFConverter(EXCEL_FILE_PATH)
-        
-        # Get available sheets
-        available_sheets = converter.get_available_sheets()
+        converter = _get_converter(EXCEL_FILE_PATH, mtime)
+
+        # Get available sheets (cached across reruns)
+        available_sheets = _get_available_sheets(EXCEL_FILE_PATH, mtime)
         
         # Display file information
         st.markdown('<h2 class="section-header">📋 Excel File Analysis</h2>', unsafe_allow_html=True)
         
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.info(f"**File Name:** {EXCEL_FILE_PATH}")
-            st.info(f"**File Size:** {file_size:,} bytes")
-            st.info(f"**Total Sheets:** {len(available_sheets)}")
-        
-        with col2:
-            st.info(f"**Available Sheets:**")
-            for sheet in available_sheets:
-                st.write(f"• {sheet}")
+        # One table instead of a column of st.info/st.write calls - a
+        # single message over the websocket rather than one per line
+        import pandas as pd
+
+        file_info = {
+            "File Name": EXCEL_FILE_PATH,
+            "File Size": f"{file_size:,} bytes",
+            "Total Sheets": str(len(available_sheets)),
+            "Available Sheets": ", ".join(available_sheets),
+        }
+        st.table(pd.Series(file_info, name="Value").to_frame())
         
         # Auto-select proforma sheets
-        proforma_sheets = ['Assumptions', 'Proforma', 'Proforma Condensed', 'Calculations']
-        selected_sheets = [sheet for sheet in proforma_sheets if sheet in available_sheets]
+        available = _PROFORMA & set(available_sheets)
+        selected_sheets = [sheet for sheet in _PROFORMA_ORDER if sheet in available]
         
         if not selected_sheets:
             st.error("❌ No proforma sheets found in the Excel file.")
@@ -149,29 +268,10 @@ def main():
         # Sheet validation and preview
         st.markdown('<h2 class="section-header">🔍 Sheet Data Preview</h2>', unsafe_allow_html=True)
         
-        validation_results = converter.validate_sheets(selected_sheets)
-        
-        for sheet_name in selected_sheets:
-            with st.expander(f"📊 {sheet_name}", expanded=False):
-                if validation_results.get(sheet_name, False):
-                    try:
-                        # Load sheet data
-                        df = converter.excel_reader.read_sheet(sheet_name)
-                        
-                        st.write(f"**Dimensions:** {df.shape[0]} rows × {df.shape[1]} columns")
-                        st.write(f"**Data Types:** {', '.join(df.dtypes.astype(str).unique())}")
-                        
-                        # Show preview
-                        if not df.empty:
-                            st.write("**Preview (first 10 rows):**")
-                            st.dataframe(df.head(10), use_container_width=True)
-                        else:
-                            st.warning("This sheet is empty.")
-                            
-                    except Exception as e:
-                        st.error(f"Error reading sheet: {e}")
-                else:
-                    st.error("Sheet not found or has no data.")
+        validation_results = _validate_sheets(EXCEL_FILE_PATH, mtime,
+                                              tuple(selected_sheets))
+
+        _render_previews(selected_sheets, validation_results, mtime)
         
         # Conversion button
         st.markdown('<h2 class="section-header">🔄 Generate PDF</h2>', unsafe_allow_html=True)
@@ -181,41 +281,49 @@ def main():
                 try:
                     # Load proforma sheets
                     converter.load_proforma_sheets()
-                    
-                    # Generate PDF with custom filename
-                    pdf_path = converter.convert_to_pdf(
-                        pdf_filename=pdf_filename,
+
+                    # Build the PDF straight into memory - no disk round-trip
+                    pdf_buffer = io.BytesIO()
+                    converter.convert_to_pdf(
                         include_sheet_summaries=include_summaries,
                         max_rows_per_sheet=max_rows,
-                        max_cols_per_sheet=max_cols
+                        max_cols_per_sheet=max_cols,
+                        output=pdf_buffer
                     )
-                    
-                    # Read the generated PDF
-                    with open(pdf_path, "rb") as pdf_file:
-                        pdf_bytes = pdf_file.read()
-                    
+                    pdf_size = pdf_buffer.getbuffer().nbytes
+
                     # Success message
-                    st.markdown('<div class="success-message">✅ PDF generated successfully!</div>', 
+                    st.markdown('<div class="success-message">✅ PDF generated successfully!</div>',
                               unsafe_allow_html=True)
-                    
-                    # Download button
+
+                    # Hand the buffer itself to the download button - it
+                    # reads the file-like object, so the PDF bytes are
+                    # never duplicated via getvalue()
+                    pdf_buffer.seek(0)
                     st.download_button(
                         label="📥 Download PDF",
-                        data=pdf_bytes,
+                        data=pdf_buffer,
                         file_name=pdf_filename,
                         mime="application/pdf",
                         use_container_width=True
                     )
-                    
+
                     # Show file info
                     st.info(f"**PDF generated:** {pdf_filename}")
-                    st.info(f"**File size:** {len(pdf_bytes):,} bytes")
+                    st.info(f"**File size:** {pdf_size:,} bytes")
                     st.info(f"**Sheets included:** {len(selected_sheets)}")
                     
                 except Exception as e:
                     logger.error(f"Conversion error: {e}")
-                    st.markdown(f'<div class="error-message">❌ Error during conversion: {str(e)}</div>', 
+                    st.markdown(f'<div class="error-message">❌ Error during conversion: {str(e)}</div>',
                               unsafe_allow_html=True)
+                finally:
+                    # The download button has its own copy of the bytes;
+                    # drop the conversion working set (loaded frames and
+                    # the reader's sheet cache) so it does not linger
+                    # across reruns in a long session
+                    converter.release_sheets()
+                    gc.collect()
         
     except Exception as e:
         logger.error(f"Application error: {e}")